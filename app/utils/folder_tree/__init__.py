@@ -1,4 +1,4 @@
-from .manager import create_folder_tree, get_flat_path_map, validate_folder_tree, cleanup_folder_tree, generate_tree_summary
+from .manager import create_folder_tree, get_flat_path_map, validate_folder_tree, cleanup_folder_tree, generate_tree_summary, compile_tree, TreePlan
 from .loaders import load_tree_from_json, load_tree_from_yaml
 from .exceptions import FolderTreeError, ConfigError, ValidationError
 
@@ -6,6 +6,8 @@ __all__ = [
     "create_folder_tree",
     "get_flat_path_map",
     "validate_folder_tree",
+    "compile_tree",
+    "TreePlan",
     "load_tree_from_json",
     "load_tree_from_yaml",
     "FolderTreeError",
@@ -1,12 +1,30 @@
+import errno
 import os
 import shutil
+import stat
+import time
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import Union, List, Optional
+from dataclasses import dataclass
+from typing import Union, List, Optional, Dict, Tuple, Sequence
 import logging
 
 logger = logging.getLogger(__name__)
 
+_MISSING_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP)
+
+@dataclass(frozen=True)
+class EntryInfo:
+    """
+    Type information for a directory entry, as returned by scandir(). is_dir and
+    is_file follow symlinks; is_symlink marks entries whose target may be missing.
+    """
+    name: str
+    is_dir: bool
+    is_file: bool
+    is_symlink: bool = False
+
+
 class BaseStorageAdapter(ABC):
     """Abstract base class for all storage operations."""
     
@@ -15,6 +33,15 @@ class BaseStorageAdapter(ABC):
         """Create a directory."""
         pass
 
+    def mkdir_many(self, paths: Sequence[Union[str, Path]], *, exist_ok: bool = True):
+        """
+        Create several directories without parents. Every parent must already exist
+        or appear earlier in paths. Backends that can batch directory creation
+        override this.
+        """
+        for path in paths:
+            self.mkdir(path, parents=False, exist_ok=exist_ok)
+
     @abstractmethod
     def exists(self, path: Union[str, Path]) -> bool:
         """Check if a path exists."""
@@ -35,6 +62,30 @@ class BaseStorageAdapter(ABC):
         """Write content to a file."""
         pass
 
+    def scandir(self, path: Union[str, Path]) -> Optional[Dict[str, EntryInfo]]:
+        """
+        List the direct children of a directory, keyed by name.
+        Returns None if the backend cannot list directories; callers fall back to exists().
+        """
+        return None
+
+    def create_exclusive(self, path: Union[str, Path], content: str, overwrite: bool = False) -> bool:
+        """
+        Write a file only if it does not exist yet (or always, with overwrite).
+        Returns True if the file was written. The parent directory must exist.
+        """
+        if self.exists(path) and not overwrite:
+            return False
+        self.write_file(path, content, overwrite=overwrite)
+        return True
+
+    def write_file_fast(self, path: Union[str, Path], content: bytes, overwrite: bool = False) -> bool:
+        """
+        Same contract as create_exclusive() for pre-encoded UTF-8 content. Backends
+        with a cheaper byte-level write override this.
+        """
+        return self.create_exclusive(path, content.decode("utf-8"), overwrite=overwrite)
+
     @abstractmethod
     def remove(self, path: Union[str, Path], recursive: bool = False):
         """Remove a file or directory."""
@@ -50,40 +101,165 @@ class BaseStorageAdapter(ABC):
         """Change permissions."""
         pass
 
+    def flush(self):
+        """Commit any deferred operations. Adapters that write immediately need not override this."""
+        pass
+
 
 class LocalFileSystemAdapter(BaseStorageAdapter):
-    """Implementation for local filesystem using pathlib and os."""
+    """
+    Implementation for local filesystem using pathlib and os.
+
+    With cache_stat=True, exists/is_file/is_dir results (hits and misses) and
+    scandir() listings are cached for cache_ttl seconds, keyed by the path as
+    given. Changes made through this
+    adapter invalidate the cache; changes made elsewhere may go unseen until the
+    TTL expires, so only enable it for read-mostly workloads such as repeated validation.
+    """
+
+    def __init__(self, cache_stat: bool = False, cache_ttl: float = 1.0):
+        self._cache_stat = cache_stat
+        self._cache_ttl = cache_ttl
+        self._stat_cache: Dict[str, Tuple[float, Optional[int]]] = {}
+        self._list_cache: Dict[str, Tuple[float, Dict[str, EntryInfo]]] = {}
+
+    def _mode(self, path: Union[str, Path]) -> Optional[int]:
+        """st_mode of path (following symlinks), or None if it does not exist."""
+        key = os.fspath(path)
+        if self._cache_stat:
+            now = time.monotonic()
+            cached = self._stat_cache.get(key)
+            if cached is not None and now - cached[0] < self._cache_ttl:
+                return cached[1]
+        try:
+            mode = os.stat(key).st_mode
+        except OSError as e:
+            # Same errors Path.exists() treats as "does not exist"
+            if e.errno not in _MISSING_ERRNOS:
+                raise
+            mode = None
+        except ValueError:
+            mode = None
+        if self._cache_stat:
+            self._stat_cache[key] = (now, mode)
+        return mode
+
+    def invalidate(self, path: Optional[Union[str, Path]] = None):
+        """
+        Drop cached stat results and listings for path, its ancestors and
+        descendants (all if None).
+        """
+        if not self._stat_cache and not self._list_cache:
+            return
+        if path is None:
+            self._stat_cache.clear()
+            self._list_cache.clear()
+            return
+        key = os.fspath(path).rstrip(os.sep)
+        prefix = key + os.sep
+        for cache in (self._stat_cache, self._list_cache):
+            for cached in list(cache):
+                if cached == key or cached.startswith(prefix) or prefix.startswith(cached.rstrip(os.sep) + os.sep):
+                    cache.pop(cached, None)
 
     def mkdir(self, path: Union[str, Path], parents: bool = True, exist_ok: bool = True):
-        Path(path).mkdir(parents=parents, exist_ok=exist_ok)
+        self.invalidate(path)
+        if parents:
+            Path(path).mkdir(parents=True, exist_ok=exist_ok)
+            return
+        self._mkdir_one(path, exist_ok)
+
+    def mkdir_many(self, paths: Sequence[Union[str, Path]], *, exist_ok: bool = True):
+        # A thread pool cannot help here: each path may depend on an earlier one,
+        # and mkdir is a single cheap syscall. The win is dropping the per-path
+        # cache invalidation and Path handling.
+        self.invalidate()
+        mkdir_one = self._mkdir_one
+        for path in paths:
+            mkdir_one(path, exist_ok)
+
+    @staticmethod
+    def _mkdir_one(path: Union[str, Path], exist_ok: bool):
+        # Parent-first callers (create_folder_tree) go straight to the syscall; the
+        # directory check only runs when the path already exists.
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not exist_ok or not os.path.isdir(path):
+                raise
 
     def exists(self, path: Union[str, Path]) -> bool:
-        return Path(path).exists()
+        return self._mode(path) is not None
 
     def is_file(self, path: Union[str, Path]) -> bool:
-        return Path(path).is_file()
+        mode = self._mode(path)
+        return mode is not None and stat.S_ISREG(mode)
 
     def is_dir(self, path: Union[str, Path]) -> bool:
-        return Path(path).is_dir()
+        mode = self._mode(path)
+        return mode is not None and stat.S_ISDIR(mode)
 
     def write_file(self, path: Union[str, Path], content: str, overwrite: bool = False):
-        p = Path(path)
-        if not p.exists() or overwrite:
-            p.parent.mkdir(parents=True, exist_ok=True)
-            with open(p, "w", encoding="utf-8") as f:
-                f.write(content)
+        data = content.encode("utf-8")
+        try:
+            self.write_file_fast(path, data, overwrite=overwrite)
+        except FileNotFoundError:
+            # Only pay for the parent mkdir when the parent is actually missing
+            self.mkdir(Path(path).parent, parents=True, exist_ok=True)
+            self.write_file_fast(path, data, overwrite=overwrite)
+
+    def scandir(self, path: Union[str, Path]) -> Optional[Dict[str, EntryInfo]]:
+        key = os.fspath(path)
+        if self._cache_stat:
+            now = time.monotonic()
+            cached = self._list_cache.get(key)
+            if cached is not None and now - cached[0] < self._cache_ttl:
+                return cached[1]
+        # DirEntry type checks use d_type from getdents; only symlinks need a stat.
+        with os.scandir(key) as it:
+            entries = {e.name: EntryInfo(e.name, e.is_dir(), e.is_file(), e.is_symlink()) for e in it}
+        if self._cache_stat:
+            self._list_cache[key] = (now, entries)
+        return entries
+
+    def create_exclusive(self, path: Union[str, Path], content: str, overwrite: bool = False) -> bool:
+        return self.write_file_fast(path, content.encode("utf-8") if content else b"", overwrite=overwrite)
+
+    def write_file_fast(self, path: Union[str, Path], content: bytes, overwrite: bool = False) -> bool:
+        # Raw fd I/O: no stat (O_EXCL reports "already exists"), no buffered/text wrappers.
+        self.invalidate(path)
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if overwrite else os.O_EXCL)
+        try:
+            fd = os.open(path, flags, 0o666)
+        except FileExistsError:
+            return False
+        try:
+            # os.write() may write less than asked (signals, pipes, some filesystems)
+            view = memoryview(content)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        return True
 
     def remove(self, path: Union[str, Path], recursive: bool = False):
-        p = Path(path)
-        if p.is_file():
-            p.unlink()
-        elif p.is_dir():
+        self.invalidate(path)
+        # One lstat decides the branch; a symlink is removed itself, never its target.
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            return
+        if stat.S_ISDIR(mode):
             if recursive:
-                shutil.rmtree(p)
+                shutil.rmtree(path)
             else:
-                p.rmdir()
+                os.rmdir(path)
+        elif stat.S_ISREG(mode) or stat.S_ISLNK(mode):
+            os.unlink(path)
 
     def move(self, src: Union[str, Path], dst: Union[str, Path]):
+        self.invalidate(src)
+        self.invalidate(dst)
         shutil.move(str(src), str(dst))
 
     def chmod(self, path: Union[str, Path], mode: int):
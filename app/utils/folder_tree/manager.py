@@ -1,16 +1,62 @@
 import logging
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Union, Any, Optional
+from typing import Dict, Union, Any, Optional, Iterator, Tuple, List
 
 from .exceptions import FolderTreeError, ValidationError, MigrationError
 from .adapters import BaseStorageAdapter, LocalFileSystemAdapter
 
+try:
+    # Optional Cython build of the create loop (see _manager_fast.pyx).
+    from ._manager_fast import create_tree_c
+except ImportError:
+    create_tree_c = None
+
 logger = logging.getLogger(__name__)
 
 # Type alias for the tree structure
 TreeStructure = Dict[str, Union[Dict, Any]]
 
+# Thread pool sizing for create_folder_tree(parallel=True)
+_PARALLEL_MIN_FILES = 4
+_PARALLEL_MAX_WORKERS = 32
+
+# Walkers build child paths as plain strings; Path objects are only created for results.
+_SEP = os.sep
+_ALTSEP = os.altsep
+
+def _prefix(path: Union[str, Path]) -> str:
+    """
+    Returns path as a string ending in a separator, ready for `prefix + key`.
+    An empty or "." base (relative keys on object stores) gives an empty prefix.
+    """
+    s = str(path)
+    if s in ("", "."):
+        return ""
+    return s if s.endswith(_SEP) else s + _SEP
+
+def _spans_levels(key: str) -> bool:
+    """True if key names a nested path ("docs/api") rather than a single entry."""
+    return _SEP in key or bool(_ALTSEP and _ALTSEP in key)
+
+def _partition(structure: TreeStructure) -> Tuple[List[Tuple[str, Any]], Any]:
+    """
+    Splits a folder dict in one pass into its visible (key, value) items and its
+    "_perms" value (None if absent). Keys starting with "_" are never visible.
+    """
+    visible = []
+    perms = None
+    for item in structure.items():
+        key = item[0]
+        if key[:1] != "_":
+            visible.append(item)
+        elif key == "_perms":
+            perms = item[1]
+    return visible, perms
+
 def _resolve_path(path: Union[str, Path]) -> Path:
     """Helper to resolve paths with env vars and user expansion (Local only)."""
     s = str(path)
@@ -18,6 +64,100 @@ def _resolve_path(path: Union[str, Path]) -> Path:
     s = os.path.expanduser(s)
     return Path(s).resolve()
 
+@dataclass(frozen=True)
+class PathInfo:
+    """A declared path and what storage reported for it during a walk."""
+    path: str
+    exists: bool
+    is_dir: bool
+
+@dataclass(frozen=True)
+class TreePlan:
+    """
+    A structure compiled once into flat sequences, relative to any base path.
+
+    nodes holds (keys, rel_path, parent_rel_path, is_folder) for every visible entry
+    in breadth-first order, so parents always precede their children. Relative
+    paths are joined with os.sep; the top level has parent_rel_path "". A key may
+    itself contain separators ("docs/api", "sub/file.txt"); folders then also lists
+    the folders it implies, parents first. layers splits folders by path depth
+    (top level first), so each layer only depends on earlier ones. File contents
+    are stored UTF-8 encoded.
+    """
+    nodes: Tuple[Tuple[Tuple[str, ...], str, str, bool], ...]
+    folders: Tuple[str, ...]
+    layers: Tuple[Tuple[str, ...], ...]
+    files: Tuple[Tuple[str, bytes], ...]
+    perms: Dict[str, int]
+
+def compile_tree(structure: TreeStructure) -> TreePlan:
+    """
+    Compiles a structure into a TreePlan in a single walk.
+
+    Any tree operation accepts the plan in place of the structure, so a structure
+    used for several operations (validate then create, create then flat map) is
+    only walked once. The plan is a snapshot; later edits to structure are not seen.
+    """
+    nodes = []
+    folders = []
+    seen = set()
+    files = []
+    perms = {}
+
+    def add_implied(rel: str, start: int):
+        # Folders named by the separators inside a key, e.g. "docs" for "docs/api"
+        end = rel.find(_SEP, start)
+        while end != -1:
+            implied = rel[:end]
+            if end > start and implied not in seen:
+                seen.add(implied)
+                folders.append(implied)
+            start = end + 1
+            end = rel.find(_SEP, start)
+
+    queue = deque([((), "", _partition(structure)[0])])
+    while queue:
+        parent_keys, parent, visible = queue.popleft()
+        rel_prefix = parent + _SEP if parent else ""
+        for key, value in visible:
+            keys = parent_keys + (key,)
+            if _ALTSEP and _ALTSEP in key:
+                key = key.replace(_ALTSEP, _SEP)
+            rel = rel_prefix + key
+            if isinstance(value, dict):
+                child_visible, mode = _partition(value)
+                nodes.append((keys, rel, parent, True))
+                if _SEP in key:
+                    add_implied(rel, len(rel_prefix))
+                if rel not in seen:
+                    seen.add(rel)
+                    folders.append(rel)
+                # Exact type check: skips the isinstance MRO walk and rejects bools
+                if type(mode) is int:
+                    perms[rel] = mode
+                queue.append((keys, rel, child_visible))
+            else:
+                nodes.append((keys, rel, parent, False))
+                if _SEP in key:
+                    add_implied(rel, len(rel_prefix))
+                # Encoded once at compile time; empty files skip the codec entirely
+                content = value.encode("utf-8") if isinstance(value, str) and value not in ("file", "") else b""
+                files.append((rel, content))
+
+    # Grouped by separator count rather than walk depth, since a key may span levels.
+    depth_map: Dict[int, List[str]] = {}
+    for rel in folders:
+        depth_map.setdefault(rel.count(_SEP), []).append(rel)
+    layers = tuple(tuple(depth_map[d]) for d in sorted(depth_map))
+    return TreePlan(tuple(nodes), tuple(folders), layers, tuple(files), perms)
+
+def _as_plan(structure: Union[TreeStructure, TreePlan]) -> TreePlan:
+    return structure if isinstance(structure, TreePlan) else compile_tree(structure)
+
+# Listing states used by FolderTreeManager._scan
+_UNLISTED = object()
+_ABSENT = object()
+
 class FolderTreeManager:
     """
     Manager class to handle folder tree operations using various storage adapters.
@@ -25,21 +165,94 @@ class FolderTreeManager:
     def __init__(self, adapter: Optional[BaseStorageAdapter] = None):
         self.adapter = adapter or LocalFileSystemAdapter()
 
+    def _resolve(self, path: Union[str, Path]) -> Path:
+        """Resolves a user-supplied path once; everything derived from it via `/` stays resolved."""
+        if isinstance(self.adapter, LocalFileSystemAdapter):
+            return _resolve_path(path)
+        return Path(path)
+
+    def _use_fast_path(self, parallel: bool) -> bool:
+        """
+        The compiled loop only speaks to the local filesystem directly, so it is
+        skipped for other adapters (including subclasses and mocks), for thread
+        pool writes, and when per-path debug logging is requested.
+        """
+        return (
+            create_tree_c is not None
+            and not parallel
+            and type(self.adapter) is LocalFileSystemAdapter
+            and not logger.isEnabledFor(logging.DEBUG)
+        )
+
+    def _scan(self, base: str, plan: TreePlan) -> Iterator[PathInfo]:
+        """
+        Yields a PathInfo for every node of plan, parents first. An existing folder is
+        listed once via adapter.scandir(), when its first child is checked; children
+        of a missing folder are reported absent without touching storage. Keys that
+        contain a separator or are not in the listing, symlinks (which may dangle) and
+        children of folders that cannot be listed are checked with adapter.exists()
+        instead, so results match the per-path checks.
+        """
+        prefix = _prefix(base)
+        # Parent rel path -> scandir() result, None if the adapter cannot list, or a state marker
+        listings: Dict[str, Any] = {"": _UNLISTED}
+
+        for keys, rel, parent, is_folder in plan.nodes:
+            p = prefix + rel
+            entries = listings[parent]
+            if entries is _UNLISTED:
+                try:
+                    entries = self.adapter.scandir(prefix + parent if parent else base)
+                except (FileNotFoundError, NotADirectoryError):
+                    entries = _ABSENT
+                except PermissionError:
+                    # Traversable but not readable: per-path checks still work
+                    entries = None
+                listings[parent] = entries
+
+            if entries is _ABSENT:
+                found = is_dir = False
+            elif entries is None:
+                # Adapter cannot list directories
+                found = is_dir = self.adapter.exists(p)
+            else:
+                # A key spanning several levels is not an entry of the parent listing
+                entry = None if _spans_levels(keys[-1]) else entries.get(keys[-1])
+                if entry is not None and not entry.is_symlink:
+                    found = True
+                    is_dir = entry.is_dir
+                else:
+                    # Misses are confirmed too: on a case-insensitive filesystem "Docs"
+                    # exists even though the listing only has "docs"
+                    found = self.adapter.exists(p)
+                    is_dir = found and self.adapter.is_dir(p)
+
+            if is_folder:
+                listings[rel] = _UNLISTED if is_dir else _ABSENT
+            yield PathInfo(p, found, is_dir)
+
     def create_folder_tree(
         self,
         base_path: Union[str, Path],
-        structure: TreeStructure,
+        structure: Union[TreeStructure, TreePlan],
         overwrite: bool = False,
-        dry_run: bool = False
-    ) -> Dict[str, Any]:
+        dry_run: bool = False,
+        *,
+        return_flat: bool = False,
+        separator: str = "_",
+        parallel: bool = False
+    ) -> Union[Dict[str, Any], Tuple[Dict[str, Any], Dict[str, Path]]]:
         """
-        Recursively creates a folder tree starting from base_path.
+        Creates a folder tree starting from base_path.
+
+        Folders are created first, one depth level per adapter.mkdir_many() call,
+        then files, then _perms modes are applied.
+        With return_flat=True, returns (nested_paths, flat_map) where flat_map
+        matches get_flat_path_map(base_path, structure, separator), built during
+        the same walk. With parallel=True, files are written from a thread pool
+        (small trees are still written inline).
         """
-        # If using local adapter, resolve the path
-        if isinstance(self.adapter, LocalFileSystemAdapter):
-            base = _resolve_path(base_path)
-        else:
-            base = Path(base_path)
+        base = self._resolve(base_path)
 
         if not dry_run:
             try:
@@ -47,74 +260,108 @@ class FolderTreeManager:
             except Exception as e:
                 raise FolderTreeError(f"Failed to create base directory {base}: {e}")
 
-        result_paths = {}
+        plan = _as_plan(structure)
+        prefix = _prefix(base)
+        result_paths, flat_map = _result_paths(plan, prefix, separator if return_flat else None)
+
+        if dry_run:
+            if logger.isEnabledFor(logging.INFO) and plan.nodes:
+                logger.info(
+                    "[DRY-RUN] Would create:\n%s",
+                    "\n".join(prefix + rel for _, rel, _, _ in plan.nodes),
+                )
+            return (result_paths, flat_map) if return_flat else result_paths
+
+        if self._use_fast_path(parallel):
+            try:
+                create_tree_c(os.fsencode(prefix), plan, overwrite)
+            except OSError as e:
+                logger.error("Error creating %s: %s", e.filename, e)
+                raise FolderTreeError(f"Failed to create {e.filename}: {e}")
+            finally:
+                self.adapter.invalidate()
+            return (result_paths, flat_map) if return_flat else result_paths
 
-        for key, value in structure.items():
-            if key.startswith("_"):
-                continue
+        try:
+            self._create_nodes(plan, prefix, base, overwrite, parallel)
+        except BaseException:
+            # Run whatever a deferring adapter queued before the failure (a synchronous
+            # adapter would already have done it) so none of it leaks into a later call.
+            try:
+                self.adapter.flush()
+            except Exception as e:
+                logger.warning("Could not flush pending operations under %s: %s", base, e)
+            raise
 
-            current_path = base / key
-            is_folder = isinstance(value, dict)
+        try:
+            self.adapter.flush()
+        except Exception as e:
+            logger.error("Error creating folder tree under %s: %s", base, e)
+            raise FolderTreeError(f"Failed to create folder tree under {base}: {e}")
 
-            if dry_run:
-                logger.info(f"[DRY-RUN] Would create: {current_path}")
-            else:
-                try:
-                    if is_folder:
-                        self.adapter.mkdir(current_path, parents=True, exist_ok=True)
-                        logger.debug(f"Created/Verified Folder: {current_path}")
-                        
-                        if "_perms" in value and isinstance(value["_perms"], int):
-                            self.adapter.chmod(current_path, value["_perms"])
-                    else:
-                        # Ensure parent exists
-                        self.adapter.mkdir(current_path.parent, parents=True, exist_ok=True)
-                        
-                        if not self.adapter.exists(current_path) or overwrite:
-                            content = value if isinstance(value, str) and value not in ("file", "") else ""
-                            self.adapter.write_file(current_path, content, overwrite=overwrite)
-                            logger.debug(f"Created/Updated File: {current_path}")
-
-                except Exception as e:
-                    logger.error(f"Error creating {current_path}: {e}")
-                    raise FolderTreeError(f"Failed to create {current_path}: {e}")
+        return (result_paths, flat_map) if return_flat else result_paths
 
-            if is_folder:
-                sub_results = self.create_folder_tree(current_path, value, overwrite, dry_run)
-                result_paths[key] = sub_results
-            else:
-                result_paths[key] = current_path
+    def _create_nodes(self, plan: TreePlan, prefix: str, base: Path, overwrite: bool, parallel: bool):
+        """Creates folders, files and modes of plan through the adapter, in that order."""
+        # One batch per depth: the adapter may create a layer in any order.
+        log_folders = logger.isEnabledFor(logging.DEBUG)
+        for layer in plan.layers:
+            folders = [prefix + rel for rel in layer]
+            try:
+                self.adapter.mkdir_many(folders, exist_ok=True)
+            except Exception as e:
+                # OSError names the folder that failed; other errors only the tree.
+                current_path = getattr(e, "filename", None) or base
+                logger.error("Error creating %s: %s", current_path, e)
+                raise FolderTreeError(f"Failed to create {current_path}: {e}")
+            if log_folders:
+                for current_path in folders:
+                    logger.debug("Created/Verified Folder: %s", current_path)
+
+        def _write_one(item: Tuple[str, bytes]):
+            current_path, content = item
+            try:
+                if self.adapter.write_file_fast(current_path, content, overwrite=overwrite):
+                    logger.debug("Created/Updated File: %s", current_path)
+            except Exception as e:
+                logger.error("Error creating %s: %s", current_path, e)
+                raise FolderTreeError(f"Failed to create {current_path}: {e}")
+
+        # All folders exist now, so file writes are independent of each other.
+        files = [(prefix + rel, content) for rel, content in plan.files]
+        if parallel and len(files) > _PARALLEL_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=min(_PARALLEL_MAX_WORKERS, len(files))) as pool:
+                list(pool.map(_write_one, files))
+        else:
+            for item in files:
+                _write_one(item)
 
-        return result_paths
+        # Modes go on last, children before parents, so a restrictive _perms
+        # (e.g. 0o555) cannot block creating anything beneath it.
+        for rel, perms in reversed(plan.perms.items()):
+            current_path = prefix + rel
+            try:
+                self.adapter.chmod(current_path, perms)
+            except Exception as e:
+                logger.error("Error creating %s: %s", current_path, e)
+                raise FolderTreeError(f"Failed to create {current_path}: {e}")
 
-    def validate_folder_tree(self, base_path: Union[str, Path], structure: TreeStructure) -> bool:
+    def validate_folder_tree(self, base_path: Union[str, Path], structure: Union[TreeStructure, TreePlan]) -> bool:
         """
         Validates that the folder structure exists.
         """
-        base = _resolve_path(base_path) if isinstance(self.adapter, LocalFileSystemAdapter) else Path(base_path)
+        base = self._resolve(base_path)
         
         if not self.adapter.exists(base):
              raise FolderTreeError(f"Base path does not exist: {base}")
 
-        missing = []
-
-        def _check(current_base: Path, sub_struct: Dict):
-            for key, value in sub_struct.items():
-                if key.startswith("_"):
-                    continue
-                p = current_base / key
-                if not self.adapter.exists(p):
-                    missing.append(str(p))
-                if isinstance(value, dict):
-                    _check(p, value)
-
-        _check(base, structure)
+        missing = [info.path for info in self._scan(str(base), _as_plan(structure)) if not info.exists]
         if missing:
             raise ValidationError(f"Missing {len(missing)} folders: {', '.join(missing[:5])}...")
         return True
 
     def cleanup_folder_tree(self
-, base_path: Union[str, Path], structure: TreeStructure, confirm: bool = False):
+, base_path: Union[str, Path], structure: Union[TreeStructure, TreePlan], confirm: bool = False):
         """
         Recursively deletes folders defined in the structure.
         """
@@ -122,38 +369,28 @@ class FolderTreeManager:
             logger.warning("cleanup_folder_tree called without confirm=True. Returning.")
             return
 
-        base = _resolve_path(base_path) if isinstance(self.adapter, LocalFileSystemAdapter) else Path(base_path)
-        paths_to_delete = []
-
-        def _collect(current_base: Path, sub_struct: Dict):
-            for key, value in sub_struct.items():
-                if key.startswith("_"):
-                    continue
-                p = current_base / key
-                paths_to_delete.append(p)
-                if isinstance(value, dict):
-                    _collect(p, value)
-
-        _collect(base, structure)
-        paths_to_delete.sort(key=lambda p: len(str(p)), reverse=True)
+        base = self._resolve(base_path)
+        # Existence comes from one directory listing per folder; no per-path exists() probe.
+        paths_to_delete = [info for info in self._scan(str(base), _as_plan(structure)) if info.exists]
 
-        for p in paths_to_delete:
-            if self.adapter.exists(p):
-                try:
-                    self.adapter.remove(p, recursive=False)
-                    logger.info(f"Deleted: {p}")
-                except Exception as e:
-                    logger.warning(f"Could not delete {p}: {e}")
+        # _scan yields parents first, so walking it backwards removes children before their parents.
+        for info in reversed(paths_to_delete):
+            p = info.path
+            try:
+                self.adapter.remove(p, recursive=False)
+                logger.info("Deleted: %s", p)
+            except Exception as e:
+                logger.warning("Could not delete %s: %s", p, e)
 
     def migrate(self, src: Union[str, Path], dst: Union[str, Path], dry_run: bool = False):
         """
         Moves a folder or file to a new location.
         """
-        src_path = _resolve_path(src) if isinstance(self.adapter, LocalFileSystemAdapter) else Path(src)
-        dst_path = _resolve_path(dst) if isinstance(self.adapter, LocalFileSystemAdapter) else Path(dst)
+        src_path = self._resolve(src)
+        dst_path = self._resolve(dst)
 
         if dry_run:
-            logger.info(f"[DRY-RUN] Would move {src_path} to {dst_path}")
+            logger.info("[DRY-RUN] Would move %s to %s", src_path, dst_path)
             return
 
         if not self.adapter.exists(src_path):
@@ -163,46 +400,69 @@ class FolderTreeManager:
             # Ensure destination parent exists
             self.adapter.mkdir(dst_path.parent, parents=True, exist_ok=True)
             self.adapter.move(src_path, dst_path)
-            logger.info(f"Migrated: {src_path} -> {dst_path}")
+            logger.info("Migrated: %s -> %s", src_path, dst_path)
         except Exception as e:
-            logger.error(f"Migration failed from {src_path} to {dst_path}: {e}")
+            logger.error("Migration failed from %s to %s: %s", src_path, dst_path, e)
             raise MigrationError(f"Failed to migrate: {e}")
 
-# Functional interface for backward compatibility
-def create_folder_tree(base_path, structure, overwrite=False, dry_run=False):
-    return FolderTreeManager().create_folder_tree(base_path, structure, overwrite, dry_run)
-
-def validate_folder_tree(base_path, structure):
-    return FolderTreeManager().validate_folder_tree(base_path, structure)
-
-def cleanup_folder_tree(base_path, structure, confirm=False):
-    return FolderTreeManager().cleanup_folder_tree(base_path, structure, confirm)
+# Functional interface for backward compatibility. The adapter keeps no state
+# between calls (stat caching is off by default), so one manager serves them all.
+_default_manager = FolderTreeManager()
+create_folder_tree = _default_manager.create_folder_tree
+validate_folder_tree = _default_manager.validate_folder_tree
+cleanup_folder_tree = _default_manager.cleanup_folder_tree
+
+_BRANCH = "├── "
+_LAST_BRANCH = "└── "
+_PIPE_INDENT = "│   "
+_SPACE_INDENT = "    "
+
+def _push_children(stack: list, structure: TreeStructure, indent: str):
+    """Pushes visible children in reverse so that popping yields them in order."""
+    items, _ = _partition(structure)
+    last_index = len(items) - 1
+    for i in range(last_index, -1, -1):
+        key, value = items[i]
+        stack.append((key, value, indent, i == last_index))
 
 def generate_tree_summary(structure: TreeStructure, indent: str = "", last: bool = True) -> str:
-    """(Keep as is, since it's just a string generator)"""
-    summary = ""
-    items = {k: v for k, v in structure.items() if not k.startswith("_")}
-    keys = list(items.keys())
-    count = len(keys)
-    for i, key in enumerate(keys):
-        is_last_item = (i == count - 1)
-        connector = "└── " if is_last_item else "├── "
-        summary += f"{indent}{connector}{key}\n"
-        value = items[key]
-        if isinstance(value, dict):
-            new_indent = indent + ("    " if is_last_item else "│   ")
-            summary += generate_tree_summary(value, new_indent, is_last_item)
-    return summary
-
-def get_flat_path_map(base_path: Union[str, Path], structure: TreeStructure, separator: str = "_", parent_key: str = "") -> Dict[str, Path]:
-    base = _resolve_path(base_path)
-    flat_map = {}
-    for key, value in structure.items():
-        if key.startswith("_"): continue
-        full_key = f"{parent_key}{separator}{key}" if parent_key else key
-        current_path = base / key
-        flat_map[full_key] = current_path
+    """
+    Returns a tree-style view of the structure, one line per entry.
+    """
+    parts = []
+    stack = []
+    _push_children(stack, structure, indent)
+    while stack:
+        key, value, current_indent, is_last_item = stack.pop()
+        parts.append(f"{current_indent}{_LAST_BRANCH if is_last_item else _BRANCH}{key}\n")
         if isinstance(value, dict):
-            child_map = get_flat_path_map(current_path, value, separator, full_key)
-            flat_map.update(child_map)
-    return flat_map
+            _push_children(stack, value, current_indent + (_SPACE_INDENT if is_last_item else _PIPE_INDENT))
+    return "".join(parts)
+
+def _result_paths(plan: TreePlan, prefix: str, flat_separator: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, Path]]:
+    """
+    Builds the nested path dict returned by create_folder_tree and, if flat_separator
+    is given, the matching flat map, in one pass over plan.nodes.
+    """
+    nested: Dict[str, Any] = {}
+    flat_map: Dict[str, Path] = {}
+    dirs = {"": nested}
+    for keys, rel, parent, is_folder in plan.nodes:
+        if is_folder:
+            dirs[parent][keys[-1]] = dirs[rel] = {}
+            if flat_separator is not None:
+                flat_map[flat_separator.join(keys)] = Path(prefix + rel)
+        else:
+            path = Path(prefix + rel)
+            dirs[parent][keys[-1]] = path
+            if flat_separator is not None:
+                flat_map[flat_separator.join(keys)] = path
+    return nested, flat_map
+
+def get_flat_path_map(base_path: Union[str, Path], structure: Union[TreeStructure, TreePlan], separator: str = "_", parent_key: str = "") -> Dict[str, Path]:
+    prefix = _prefix(_resolve_path(base_path))
+    key_prefix = (parent_key,) if parent_key else ()
+    return {
+        separator.join(key_prefix + keys): Path(prefix + rel)
+        for keys, rel, _, _ in _as_plan(structure).nodes
+    }
@@ -0,0 +1,301 @@
+import ctypes
+import errno
+import logging
+import os
+from pathlib import Path
+from typing import Union, List, Optional, Sequence, Tuple, Dict
+
+from .adapters import EntryInfo, LocalFileSystemAdapter
+
+logger = logging.getLogger(__name__)
+
+# The prep helpers are static inline in liburing.h; only the -ffi build exports them.
+_LIBRARY_NAMES = ("liburing-ffi.so.2", "liburing.so.2")
+
+AT_FDCWD = -100
+
+# enum io_uring_op values for the operations flush() submits
+_REQUIRED_OPS = {
+    "IORING_OP_OPENAT": 18,
+    "IORING_OP_CLOSE": 19,
+    "IORING_OP_WRITE": 23,
+    "IORING_OP_MKDIRAT": 37,
+}
+
+# sizeof(struct io_uring) is 216 bytes on 64-bit Linux; the ring is opaque to us,
+# so over-allocate rather than mirror its layout.
+_RING_BUFFER_SIZE = 512
+
+
+class _Cqe(ctypes.Structure):
+    _fields_ = [
+        ("user_data", ctypes.c_uint64),
+        ("res", ctypes.c_int32),
+        ("flags", ctypes.c_uint32),
+    ]
+
+
+def _bind(lib: ctypes.CDLL):
+    """Declare the liburing prototypes used by _Ring. Raises AttributeError if missing."""
+    vp = ctypes.c_void_p
+    signatures = {
+        "io_uring_queue_init": (ctypes.c_int, [ctypes.c_uint, vp, ctypes.c_uint]),
+        "io_uring_queue_exit": (None, [vp]),
+        "io_uring_get_sqe": (vp, [vp]),
+        "io_uring_prep_mkdirat": (None, [vp, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]),
+        "io_uring_prep_openat": (None, [vp, ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint]),
+        "io_uring_prep_write": (None, [vp, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint, ctypes.c_uint64]),
+        "io_uring_prep_close": (None, [vp, ctypes.c_int]),
+        "io_uring_sqe_set_data64": (None, [vp, ctypes.c_uint64]),
+        "io_uring_submit": (ctypes.c_int, [vp]),
+        "io_uring_wait_cqe_nr": (ctypes.c_int, [vp, ctypes.POINTER(ctypes.POINTER(_Cqe)), ctypes.c_uint]),
+        "io_uring_cqe_seen": (None, [vp, ctypes.POINTER(_Cqe)]),
+        "io_uring_get_probe": (vp, []),
+        "io_uring_opcode_supported": (ctypes.c_int, [vp, ctypes.c_int]),
+        "io_uring_free_probe": (None, [vp]),
+    }
+    for name, (restype, argtypes) in signatures.items():
+        func = getattr(lib, name)
+        func.restype = restype
+        func.argtypes = argtypes
+
+
+def _load_liburing() -> Optional[ctypes.CDLL]:
+    for name in _LIBRARY_NAMES:
+        try:
+            lib = ctypes.CDLL(name)
+            _bind(lib)
+            return lib
+        except (OSError, AttributeError):
+            continue
+    return None
+
+
+def _unsupported_ops(lib: ctypes.CDLL) -> List[str]:
+    """Names of the operations in _REQUIRED_OPS the running kernel cannot do."""
+    # A ring can be set up on kernels older than MKDIRAT (5.15); only the probe tells.
+    probe = lib.io_uring_get_probe()
+    if not probe:
+        return list(_REQUIRED_OPS)
+    try:
+        return [name for name, op in _REQUIRED_OPS.items() if not lib.io_uring_opcode_supported(probe, op)]
+    finally:
+        lib.io_uring_free_probe(probe)
+
+
+class _Ring:
+    """Thin wrapper over a liburing ring that runs one wave of operations at a time."""
+
+    def __init__(self, lib: ctypes.CDLL, entries: int):
+        self._lib = lib
+        self._ring = ctypes.create_string_buffer(_RING_BUFFER_SIZE)
+        ret = lib.io_uring_queue_init(entries, self._ring, 0)
+        if ret < 0:
+            raise OSError(-ret, os.strerror(-ret))
+        self.entries = entries
+
+    def close(self):
+        if self._ring is not None:
+            self._lib.io_uring_queue_exit(self._ring)
+            self._ring = None
+
+    def run(self, ops: List[Tuple]) -> List[int]:
+        """
+        Submits ops (tuples of prep function name and its arguments) and returns
+        the cqe result for each, in order. Operations inside a wave are unordered.
+        """
+        lib = self._lib
+        results = [0] * len(ops)
+        cqe = ctypes.POINTER(_Cqe)()
+        for start in range(0, len(ops), self.entries):
+            chunk = ops[start:start + self.entries]
+            for index, (prep, *args) in enumerate(chunk, start):
+                sqe = lib.io_uring_get_sqe(self._ring)
+                getattr(lib, prep)(sqe, *args)
+                lib.io_uring_sqe_set_data64(sqe, index)
+
+            submitted = lib.io_uring_submit(self._ring)
+            if submitted < 0:
+                raise OSError(-submitted, os.strerror(-submitted))
+
+            # Only submitted entries complete. The first wait blocks for all of them;
+            # the rest are already reaped.
+            wait_nr = submitted
+            for _ in range(submitted):
+                ret = lib.io_uring_wait_cqe_nr(self._ring, ctypes.byref(cqe), wait_nr)
+                if ret < 0:
+                    raise OSError(-ret, os.strerror(-ret))
+                results[cqe.contents.user_data] = cqe.contents.res
+                lib.io_uring_cqe_seen(self._ring, cqe)
+                wait_nr = 1
+            if submitted < len(chunk):
+                raise OSError(errno.EBUSY, f"io_uring accepted {submitted} of {len(chunk)} operations")
+        return results
+
+
+class IoUringAdapter(LocalFileSystemAdapter):
+    """
+    Local filesystem adapter that batches folder/file creation through io_uring.
+
+    mkdir(parents=False), mkdir_many() and file writes are deferred until flush(), which submits
+    directories one depth level at a time (parents before children) and then opens,
+    writes and closes files in three waves; queued chmods run last. FolderTreeManager.create_folder_tree
+    calls flush() itself; direct callers must do so too.
+
+    Falls back to plain LocalFileSystemAdapter behaviour when liburing is not
+    available, the kernel does not support mkdirat/openat/write/close on io_uring,
+    or it refuses to set up a ring.
+    """
+
+    def __init__(self, queue_depth: int = 256):
+        super().__init__()
+        self._ring: Optional[_Ring] = None
+        self._dirs: List[Tuple[str, bool]] = []
+        # (path, content, overwrite, create_parents)
+        self._files: List[Tuple[str, bytes, bool, bool]] = []
+        self._chmods: List[Tuple[str, int]] = []
+
+        lib = _load_liburing()
+        if lib is None:
+            logger.info("liburing not available; IoUringAdapter will write synchronously.")
+            return
+        missing = _unsupported_ops(lib)
+        if missing:
+            logger.info("io_uring lacks %s; IoUringAdapter will write synchronously.", ", ".join(missing))
+            return
+        try:
+            self._ring = _Ring(lib, queue_depth)
+        except OSError as e:
+            logger.info("io_uring setup failed (%s); IoUringAdapter will write synchronously.", e)
+
+    @property
+    def available(self) -> bool:
+        return self._ring is not None
+
+    def close(self):
+        """Flush pending operations and release the ring."""
+        self.flush()
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+
+    def mkdir(self, path: Union[str, Path], parents: bool = True, exist_ok: bool = True):
+        # Ancestors are only known to exist once they are created, so parents=True
+        # (the tree base, migrate targets) stays synchronous.
+        if self._ring is None or parents:
+            super().mkdir(path, parents=parents, exist_ok=exist_ok)
+            return
+        self._dirs.append((str(path), exist_ok))
+
+    def mkdir_many(self, paths: Sequence[Union[str, Path]], *, exist_ok: bool = True):
+        if self._ring is None:
+            super().mkdir_many(paths, exist_ok=exist_ok)
+            return
+        self._dirs.extend((str(path), exist_ok) for path in paths)
+
+    def write_file(self, path: Union[str, Path], content: str, overwrite: bool = False):
+        # Like the local adapter, a missing parent is created; flush() does it on ENOENT.
+        if self._ring is None:
+            super().write_file(path, content, overwrite=overwrite)
+            return
+        self._files.append((str(path), content.encode("utf-8"), overwrite, True))
+
+    def write_file_fast(self, path: Union[str, Path], content: bytes, overwrite: bool = False) -> bool:
+        # create_exclusive() funnels through here. Deferred: an existing file is
+        # skipped at flush() via O_EXCL, so this reports queued.
+        if self._ring is None:
+            return super().write_file_fast(path, content, overwrite=overwrite)
+        self._files.append((str(path), content, overwrite, False))
+        return True
+
+    def chmod(self, path: Union[str, Path], mode: int):
+        if self._ring is None or not (self._dirs or self._files):
+            super().chmod(path, mode)
+            return
+        self._chmods.append((str(path), mode))
+
+    def _mode(self, path: Union[str, Path]) -> Optional[int]:
+        # exists/is_file/is_dir must see queued work
+        self.flush()
+        return super()._mode(path)
+
+    def scandir(self, path: Union[str, Path]) -> Optional[Dict[str, EntryInfo]]:
+        self.flush()
+        return super().scandir(path)
+
+    def remove(self, path: Union[str, Path], recursive: bool = False):
+        self.flush()
+        super().remove(path, recursive=recursive)
+
+    def move(self, src: Union[str, Path], dst: Union[str, Path]):
+        self.flush()
+        super().move(src, dst)
+
+    def flush(self):
+        """Submit all deferred operations. Raises OSError for the first failure."""
+        if self._ring is None or not (self._dirs or self._files or self._chmods):
+            return
+        # Taken off the queue first, so a failure never leaves work for a later flush
+        dirs, self._dirs = self._dirs, []
+        chmods, self._chmods = self._chmods, []
+        files, self._files = self._files, []
+
+        self._flush_dirs(dirs)
+        self._flush_files(files)
+        # Queued after the writes they follow, as create_folder_tree issues them
+        for path, mode in chmods:
+            os.chmod(path, mode)
+
+    def _flush_dirs(self, dirs: List[Tuple[str, bool]]):
+        waves = {}
+        for path, exist_ok in dirs:
+            waves.setdefault(path.count(os.sep), []).append((path, exist_ok))
+
+        for depth in sorted(waves):
+            wave = waves[depth]
+            ops = [("io_uring_prep_mkdirat", AT_FDCWD, os.fsencode(p), 0o777) for p, _ in wave]
+            for (path, exist_ok), res in zip(wave, self._ring.run(ops)):
+                if res == -errno.EEXIST and exist_ok and os.path.isdir(path):
+                    continue
+                if res < 0:
+                    raise OSError(-res, os.strerror(-res), path)
+
+    def _flush_files(self, files: List[Tuple[str, bytes, bool, bool]]):
+        if not files:
+            return
+        opens = []
+        for path, _, overwrite, _ in files:
+            flags = os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC | (os.O_TRUNC if overwrite else os.O_EXCL)
+            opens.append(("io_uring_prep_openat", AT_FDCWD, os.fsencode(path), flags, 0o666))
+
+        fds = []
+        retry = []
+        error: Optional[OSError] = None
+        for (path, data, overwrite, create_parents), res in zip(files, self._ring.run(opens)):
+            if res >= 0:
+                fds.append((res, data))
+            elif res == -errno.EEXIST and not overwrite:
+                continue
+            elif res == -errno.ENOENT and create_parents:
+                retry.append((path, data, overwrite))
+            elif error is None:
+                error = OSError(-res, os.strerror(-res), path)
+
+        written = [(fd, data) for fd, data in fds if data]
+        writes = [("io_uring_prep_write", fd, data, len(data), 0) for fd, data in written]
+        for (_, data), res in zip(written, self._ring.run(writes)):
+            if error is not None:
+                break
+            if res < 0:
+                error = OSError(-res, os.strerror(-res))
+            elif res < len(data):
+                error = OSError(errno.EIO, "Short write")
+
+        self._ring.run([("io_uring_prep_close", fd) for fd, _ in fds])
+        if error is not None:
+            raise error
+
+        # write_file() targets whose parent was missing: rare, so done synchronously
+        for path, data, overwrite in retry:
+            super().mkdir(os.path.dirname(path), parents=True, exist_ok=True)
+            super().write_file_fast(path, data, overwrite=overwrite)
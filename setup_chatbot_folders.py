@@ -1,4 +1,4 @@
-from app.utils.folder_tree import create_folder_tree, generate_tree_summary, get_flat_path_map
+from app.utils.folder_tree import create_folder_tree, generate_tree_summary
 import os
 
 # 1. Define the Chatbot Data Structure
@@ -33,11 +33,9 @@ def main():
     print(generate_tree_summary(chatbot_structure))
     
     print("\nCreating Folders...")
-    paths = create_folder_tree(base_dir, chatbot_structure)
-    
     # Example of accessing paths
-    # We can use the flat map for easy access
-    flat_paths = get_flat_path_map(base_dir, chatbot_structure)
+    # We can use the flat map for easy access (built in the same pass as creation)
+    paths, flat_paths = create_folder_tree(base_dir, chatbot_structure, return_flat=True)
     
     # Let's say we want to save an image
     img_path = flat_paths["chatbot_data_raw_uploads_images"]
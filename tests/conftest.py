@@ -0,0 +1,18 @@
+import copy
+import pytest
+
+TREE = {
+    "a": {
+        "b": {"c": {"deep.txt": "deep"}},
+        "empty.txt": "",
+    },
+    "locked": {"_perms": 0o700},
+    # Restrictive mode above content: only works if modes are applied last
+    "readonly": {"_perms": 0o555, "inner": {"_perms": 0o700, "note.txt": "note"}},
+    "top.txt": "top",
+}
+
+@pytest.fixture
+def tree_structure():
+    """A structure with nested files, empty files and _perms, shared by adapter-level tests."""
+    return copy.deepcopy(TREE)
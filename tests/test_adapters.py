@@ -22,6 +22,33 @@ def test_local_mkdir_parents(adapter, temp_path):
     adapter.mkdir(nested_dir, parents=True)
     assert nested_dir.is_dir()
 
+def test_local_mkdir_no_parents(adapter, temp_path):
+    new_dir = temp_path / "flat"
+    adapter.mkdir(new_dir, parents=False)
+    adapter.mkdir(new_dir, parents=False, exist_ok=True)
+    assert new_dir.is_dir()
+
+    with pytest.raises(FileExistsError):
+        adapter.mkdir(new_dir, parents=False, exist_ok=False)
+
+    (temp_path / "file.txt").write_text("x")
+    with pytest.raises(FileExistsError):
+        adapter.mkdir(temp_path / "file.txt", parents=False)
+
+    with pytest.raises(FileNotFoundError):
+        adapter.mkdir(temp_path / "missing" / "child", parents=False)
+
+def test_local_mkdir_many(temp_path):
+    adapter = LocalFileSystemAdapter(cache_stat=True, cache_ttl=60)
+    assert not adapter.exists(temp_path / "a")
+
+    adapter.mkdir_many([temp_path / "a", temp_path / "a" / "b", temp_path / "a"])
+    assert (temp_path / "a" / "b").is_dir()
+    assert adapter.exists(temp_path / "a")
+
+    with pytest.raises(FileExistsError):
+        adapter.mkdir_many([temp_path / "a"], exist_ok=False)
+
 def test_local_exists(adapter, temp_path):
     test_file = temp_path / "exists.txt"
     test_file.write_text("hello")
@@ -104,3 +131,129 @@ def test_stubs():
         a.remove("path")
         a.move("src", "dst")
         a.chmod("path", 0o777)
+
+def test_local_create_exclusive(adapter, temp_path):
+    test_file = temp_path / "exclusive.txt"
+    assert adapter.create_exclusive(test_file, "first") is True
+    assert test_file.read_text() == "first"
+
+    # Existing file is left alone
+    assert adapter.create_exclusive(test_file, "second") is False
+    assert test_file.read_text() == "first"
+
+    # Overwrite truncates
+    assert adapter.create_exclusive(test_file, "3", overwrite=True) is True
+    assert test_file.read_text() == "3"
+
+def test_local_scandir(adapter, temp_path):
+    (temp_path / "file.txt").write_text("hello")
+    (temp_path / "subdir").mkdir()
+
+    entries = adapter.scandir(temp_path)
+    assert set(entries) == {"file.txt", "subdir"}
+    assert entries["file.txt"].is_file and not entries["file.txt"].is_dir
+    assert entries["subdir"].is_dir and not entries["subdir"].is_file
+    assert not entries["file.txt"].is_symlink
+
+    if os.name != 'nt':
+        (temp_path / "link").symlink_to(temp_path / "subdir", target_is_directory=True)
+        assert adapter.scandir(temp_path)["link"].is_symlink
+
+    with pytest.raises(FileNotFoundError):
+        adapter.scandir(temp_path / "missing")
+
+def test_local_stat_cache(temp_path):
+    cached = LocalFileSystemAdapter(cache_stat=True, cache_ttl=60)
+    test_file = temp_path / "cached.txt"
+
+    # Negative result is cached until the adapter itself writes the path
+    assert not cached.exists(test_file)
+    test_file.write_text("external")
+    assert not cached.exists(test_file)
+    cached.write_file(test_file, "mine", overwrite=True)
+    assert cached.exists(test_file)
+    assert cached.is_file(test_file) and not cached.is_dir(test_file)
+
+    # Positive result is cached until explicitly invalidated
+    test_file.unlink()
+    assert cached.exists(test_file)
+    cached.invalidate()
+    assert not cached.exists(test_file)
+
+def test_local_stat_cache_invalidates_descendants(temp_path):
+    cached = LocalFileSystemAdapter(cache_stat=True, cache_ttl=60)
+    tree = temp_path / "tree"
+    (tree / "child").mkdir(parents=True)
+    assert cached.is_dir(tree / "child")
+
+    cached.remove(tree, recursive=True)
+    assert not cached.exists(tree / "child")
+
+def test_local_stat_cache_lists_once(temp_path, monkeypatch):
+    from app.utils.folder_tree.manager import FolderTreeManager
+    cached = LocalFileSystemAdapter(cache_stat=True, cache_ttl=60)
+    manager = FolderTreeManager(adapter=cached)
+    structure = {"a": {"b": {}, "f.txt": "x"}, "c": {}}
+    manager.create_folder_tree(temp_path, structure)
+
+    real_scandir = os.scandir
+    listed = []
+    def counting_scandir(path):
+        listed.append(path)
+        return real_scandir(path)
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+
+    for _ in range(3):
+        assert manager.validate_folder_tree(temp_path, structure)
+    # One listing each for the base and "a" (the only folders with children), then
+    # served from the cache
+    assert len(listed) == 2
+
+    # A write through the adapter invalidates the parent listing
+    cached.write_file(temp_path / "a" / "g.txt", "y")
+    assert "g.txt" in cached.scandir(temp_path / "a")
+    assert len(listed) == 3
+
+def test_local_stat_cache_ttl(temp_path):
+    cached = LocalFileSystemAdapter(cache_stat=True, cache_ttl=0)
+    test_file = temp_path / "ttl.txt"
+    assert not cached.exists(test_file)
+    test_file.write_text("x")
+    assert cached.exists(test_file)
+
+@pytest.mark.skipif(os.name == 'nt', reason="symlinks need privileges on Windows")
+def test_local_remove_symlink_to_dir(adapter, temp_path):
+    target = temp_path / "target"
+    target.mkdir()
+    link = temp_path / "link"
+    link.symlink_to(target, target_is_directory=True)
+
+    adapter.remove(link)
+    assert not link.exists() and not link.is_symlink()
+    assert target.is_dir()
+
+def test_local_remove_missing(adapter, temp_path):
+    adapter.remove(temp_path / "missing")
+
+def test_local_write_file_fast(adapter, temp_path):
+    test_file = temp_path / "fast.bin"
+    assert adapter.write_file_fast(test_file, "héllo".encode("utf-8")) is True
+    assert test_file.read_text(encoding="utf-8") == "héllo"
+    assert adapter.write_file_fast(test_file, b"ignored") is False
+
+    empty = temp_path / "empty"
+    assert adapter.write_file_fast(empty, b"") is True
+    assert empty.read_bytes() == b""
+
+def test_local_write_file_fast_short_writes(adapter, temp_path, monkeypatch):
+    real_write = os.write
+    monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, bytes(data[:2])))
+
+    test_file = temp_path / "short.bin"
+    assert adapter.write_file_fast(test_file, b"abcdefg") is True
+    assert test_file.read_bytes() == b"abcdefg"
+
+def test_local_write_file_creates_parent(adapter, temp_path):
+    test_file = temp_path / "missing" / "parent" / "file.txt"
+    adapter.write_file(test_file, "content")
+    assert test_file.read_text() == "content"
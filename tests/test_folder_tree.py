@@ -117,3 +117,149 @@ def test_generate_tree_summary():
     assert "uploads" in summary
     assert "├── raw" in summary or "└── raw" in summary
     assert "logs" in summary
+
+def test_get_flat_path_map_resolves_base_once(temp_base, monkeypatch):
+    from app.utils.folder_tree import manager
+    calls = []
+    original = manager._resolve_path
+    monkeypatch.setattr(manager, "_resolve_path", lambda p: calls.append(p) or original(p))
+
+    flat = get_flat_path_map(temp_base, SAMPLE_TREE)
+
+    assert len(calls) == 1
+    assert flat["uploads_processed_readme.txt"] == (temp_base / "uploads" / "processed" / "readme.txt").resolve()
+
+def test_generate_tree_summary_layout():
+    summary = generate_tree_summary({"a": {"b": {}, "c": "file", "_perms": 0o755}, "d": {}})
+    assert summary == (
+        "├── a\n"
+        "│   ├── b\n"
+        "│   └── c\n"
+        "└── d\n"
+    )
+
+def test_generate_tree_summary_deep():
+    # Deeper than the default recursion limit
+    tree = {}
+    node = tree
+    for _ in range(2000):
+        node["x"] = {}
+        node = node["x"]
+    assert generate_tree_summary(tree).count("└── x") == 2000
+
+def test_create_folder_tree_return_flat(temp_base):
+    paths, flat = create_folder_tree(temp_base, SAMPLE_TREE, return_flat=True)
+
+    assert flat == get_flat_path_map(temp_base, SAMPLE_TREE)
+    assert flat["uploads_processed_readme.txt"] == paths["uploads"]["processed"]["readme.txt"]
+
+def test_get_flat_path_map_separator_and_prefix(temp_base):
+    flat = get_flat_path_map(temp_base, SAMPLE_TREE, separator=".", parent_key="root")
+    assert set(flat) == {
+        "root.uploads", "root.uploads.raw", "root.uploads.processed",
+        "root.uploads.processed.images", "root.uploads.processed.text",
+        "root.uploads.processed.readme.txt", "root.logs", "root.config.json",
+    }
+
+def test_create_folder_tree_parallel(temp_base):
+    structure = {f"dir{i}": {f"file{j}.txt": f"{i}-{j}" for j in range(5)} for i in range(4)}
+    create_folder_tree(temp_base, structure, parallel=True)
+
+    for i in range(4):
+        for j in range(5):
+            assert (temp_base / f"dir{i}" / f"file{j}.txt").read_text() == f"{i}-{j}"
+
+def test_create_folder_tree_parallel_error(temp_base):
+    # A folder where a file should go makes the exclusive open fail
+    structure = {f"file{i}.txt": "x" for i in range(8)}
+    (temp_base / "file3.txt").mkdir()
+    with pytest.raises(FolderTreeError, match="file3.txt"):
+        create_folder_tree(temp_base, structure, parallel=True, overwrite=True)
+
+def test_cleanup_folder_tree_children_first(temp_base):
+    # "ab/c" is as long as "abcd" but is the only one nested; sibling order must not matter
+    structure = {"abcd": {}, "ab": {"c": {"deep": {}}}, "x": {"yy": {}}}
+    create_folder_tree(temp_base, structure)
+
+    cleanup_folder_tree(temp_base, structure, confirm=True)
+
+    assert list(temp_base.iterdir()) == []
+
+def test_compile_tree_reuse(temp_base):
+    from app.utils.folder_tree import compile_tree, TreePlan
+    plan = compile_tree(SAMPLE_TREE)
+    assert isinstance(plan, TreePlan)
+
+    # Parents come before children, relative to any base
+    assert plan.folders.index("uploads") < plan.folders.index(os.path.join("uploads", "processed"))
+    assert (os.path.join("uploads", "processed", "readme.txt"), b"") in plan.files
+    assert ("config.json", b"{}") in plan.files
+
+    paths = create_folder_tree(temp_base, plan)
+    assert validate_folder_tree(temp_base, plan) is True
+    assert get_flat_path_map(temp_base, plan) == get_flat_path_map(temp_base, SAMPLE_TREE)
+    assert paths == create_folder_tree(temp_base, SAMPLE_TREE)
+
+    cleanup_folder_tree(temp_base, plan, confirm=True)
+    assert not (temp_base / "uploads").exists()
+
+def test_compile_tree_layers():
+    from app.utils.folder_tree import compile_tree
+    plan = compile_tree(SAMPLE_TREE)
+    assert plan.layers == (
+        ("uploads", "logs"),
+        (os.path.join("uploads", "raw"), os.path.join("uploads", "processed")),
+        (os.path.join("uploads", "processed", "images"), os.path.join("uploads", "processed", "text")),
+    )
+    assert tuple(rel for layer in plan.layers for rel in layer) == plan.folders
+    assert compile_tree({"a.txt": "x"}).layers == ()
+
+def test_compile_tree_perms():
+    from app.utils.folder_tree import compile_tree
+    plan = compile_tree({"a": {"_perms": 0o700, "b": {"_perms": "755"}, "c": {"_perms": True}}})
+    assert plan.perms == {"a": 0o700}
+
+def test_functional_api_shares_manager():
+    from app.utils.folder_tree import manager
+    assert create_folder_tree.__self__ is manager._default_manager
+    assert validate_folder_tree.__self__ is manager._default_manager
+    assert cleanup_folder_tree.__self__ is manager._default_manager
+
+def test_create_folder_tree_key_with_separator(temp_base):
+    paths = create_folder_tree(temp_base, {"docs/api": {"x.txt": "y"}, "docs": {"guide": {}}})
+
+    assert (temp_base / "docs" / "api" / "x.txt").read_text() == "y"
+    assert (temp_base / "docs" / "guide").is_dir()
+    assert paths["docs/api"]["x.txt"] == temp_base / "docs" / "api" / "x.txt"
+
+    from app.utils.folder_tree import compile_tree
+    plan = compile_tree({"docs/api": {}, "docs": {}})
+    assert plan.layers == (("docs",), (os.path.join("docs", "api"),))
+
+def test_create_folder_tree_file_key_with_separator(temp_base):
+    create_folder_tree(temp_base, {"sub/file.txt": "x", "a": {"b/c.txt": "c"}})
+
+    assert (temp_base / "sub" / "file.txt").read_text() == "x"
+    assert (temp_base / "a" / "b" / "c.txt").read_text() == "c"
+
+def test_validate_and_cleanup_key_with_separator(temp_base):
+    structure = {"a/b": {"c.txt": "c"}}
+    create_folder_tree(temp_base, structure)
+
+    assert validate_folder_tree(temp_base, structure)
+
+    cleanup_folder_tree(temp_base, structure, confirm=True)
+    assert not (temp_base / "a" / "b").exists()
+    assert (temp_base / "a").is_dir()
+
+@pytest.mark.skipif(os.name == 'nt', reason="symlinks need privileges on Windows")
+def test_validate_and_cleanup_dangling_symlink(temp_base):
+    from app.utils.folder_tree import ValidationError
+    (temp_base / "f.txt").symlink_to(temp_base / "missing.txt")
+
+    # A listed name is not enough: the link's target must exist, as with exists()
+    with pytest.raises(ValidationError):
+        validate_folder_tree(temp_base, {"f.txt": "x"})
+
+    cleanup_folder_tree(temp_base, {"f.txt": "x"}, confirm=True)
+    assert (temp_base / "f.txt").is_symlink()
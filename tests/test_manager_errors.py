@@ -7,17 +7,25 @@ from app.utils.folder_tree.exceptions import FolderTreeError, ValidationError, M
 
 @pytest.fixture
 def mock_adapter():
-    return MagicMock()
+    adapter = MagicMock()
+    # No directory listing: walks fall back to exists()
+    adapter.scandir.return_value = None
+    return adapter
 
 @pytest.fixture
 def manager(mock_adapter):
     return FolderTreeManager(adapter=mock_adapter)
 
 def test_create_folder_tree_exception(manager, mock_adapter):
-    mock_adapter.mkdir.side_effect = Exception("creation failed")
+    mock_adapter.mkdir_many.side_effect = Exception("creation failed")
     with pytest.raises(FolderTreeError, match="Failed to create"):
         manager.create_folder_tree("/base", {"dir": {}})
 
+def test_create_folder_tree_names_failed_folder(manager, mock_adapter):
+    mock_adapter.mkdir_many.side_effect = FileExistsError(17, "File exists", "/base/dir")
+    with pytest.raises(FolderTreeError, match="Failed to create /base/dir"):
+        manager.create_folder_tree("/base", {"dir": {}})
+
 def test_validate_folder_tree_base_exists_error(manager, mock_adapter):
     mock_adapter.exists.return_value = False
     with pytest.raises(FolderTreeError, match="Base path does not exist"):
@@ -0,0 +1,56 @@
+import os
+import stat
+import pytest
+from app.utils.folder_tree import manager
+from app.utils.folder_tree.manager import FolderTreeManager, compile_tree
+from app.utils.folder_tree.exceptions import FolderTreeError
+
+fast = pytest.importorskip("app.utils.folder_tree._manager_fast")
+
+def _snapshot(root):
+    result = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames:
+            path = os.path.join(dirpath, name)
+            result[os.path.relpath(path, root)] = stat.S_IMODE(os.stat(path).st_mode)
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            with open(path, "rb") as f:
+                result[os.path.relpath(path, root)] = f.read()
+    return result
+
+def test_manager_uses_fast_path():
+    assert manager.create_tree_c is fast.create_tree_c
+    assert FolderTreeManager()._use_fast_path(parallel=False)
+    assert not FolderTreeManager()._use_fast_path(parallel=True)
+
+def test_matches_python_path(tmp_path, monkeypatch, tree_structure):
+    FolderTreeManager().create_folder_tree(tmp_path / "c", tree_structure)
+    monkeypatch.setattr(manager, "create_tree_c", None)
+    FolderTreeManager().create_folder_tree(tmp_path / "py", tree_structure)
+
+    assert _snapshot(tmp_path / "c") == _snapshot(tmp_path / "py")
+
+@pytest.mark.skipif(os.name == 'nt', reason="chmod works differently on Windows")
+def test_applies_perms(tmp_path, tree_structure):
+    FolderTreeManager().create_folder_tree(tmp_path, tree_structure)
+    assert (os.stat(tmp_path / "locked").st_mode & 0o777) == 0o700
+    assert (os.stat(tmp_path / "readonly").st_mode & 0o777) == 0o555
+    assert (os.stat(tmp_path / "readonly" / "inner").st_mode & 0o777) == 0o700
+    assert (tmp_path / "readonly" / "inner" / "note.txt").read_text() == "note"
+
+def test_overwrite(tmp_path):
+    plan = compile_tree({"f.txt": "new"})
+    (tmp_path / "f.txt").write_text("old")
+    prefix = os.fsencode(str(tmp_path) + os.sep)
+
+    assert fast.create_tree_c(prefix, plan, False) == 0
+    assert (tmp_path / "f.txt").read_text() == "old"
+
+    assert fast.create_tree_c(prefix, plan, True) == 1
+    assert (tmp_path / "f.txt").read_text() == "new"
+
+def test_error_names_path(tmp_path):
+    (tmp_path / "a").write_text("not a folder")
+    with pytest.raises(FolderTreeError, match="Failed to create .*a"):
+        FolderTreeManager().create_folder_tree(tmp_path, {"a": {"x.txt": "x"}})
@@ -1,8 +1,11 @@
+import logging
+import os
 import pytest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
 from app.utils.folder_tree.manager import FolderTreeManager
-from app.utils.folder_tree.adapters import BaseStorageAdapter
+from app.utils.folder_tree.adapters import BaseStorageAdapter, EntryInfo
+from app.utils.folder_tree.exceptions import FolderTreeError
 
 @pytest.fixture
 def mock_adapter():
@@ -26,20 +29,44 @@ def test_create_folder_tree_logic(manager, mock_adapter):
     
     # Check if adapter methods were called correctly
     mock_adapter.mkdir.assert_any_call(base_path, parents=True, exist_ok=True)
-    mock_adapter.mkdir.assert_any_call(base_path / "dir1", parents=True, exist_ok=True)
-    mock_adapter.write_file.assert_any_call(base_path / "dir1" / "file1.txt", "content1", overwrite=False)
-    mock_adapter.write_file.assert_any_call(base_path / "file2.txt", "content2", overwrite=False)
+    mock_adapter.mkdir_many.assert_called_once_with([str(base_path / "dir1")], exist_ok=True)
+    mock_adapter.write_file_fast.assert_any_call(str(base_path / "dir1" / "file1.txt"), b"content1", overwrite=False)
+    mock_adapter.write_file_fast.assert_any_call(str(base_path / "file2.txt"), b"content2", overwrite=False)
 
 def test_validate_folder_tree_logic(manager, mock_adapter):
     structure = {"a": {"b": {}}}
     base_path = Path("/mock/base")
     
-    mock_adapter.exists.side_effect = lambda p: p in [base_path, base_path / "a"]
+    # Adapter without directory listing falls back to exists()
+    mock_adapter.scandir.return_value = None
+    mock_adapter.exists.side_effect = lambda p: Path(p) in [base_path, base_path / "a"]
     
     from app.utils.folder_tree.exceptions import ValidationError
     with pytest.raises(ValidationError, match="Missing 1 folders"):
         manager.validate_folder_tree(base_path, structure)
 
+def test_validate_folder_tree_scandir(manager, mock_adapter):
+    structure = {"a": {"b": {}, "c": {"d": {}}}, "f.txt": ""}
+    base_path = Path("/mock/base")
+    listings = {
+        base_path: {"a": EntryInfo("a", True, False), "f.txt": EntryInfo("f.txt", False, True)},
+        base_path / "a": {"b": EntryInfo("b", True, False)},
+        base_path / "a" / "b": {},
+    }
+
+    mock_adapter.exists.side_effect = lambda p: Path(p) == base_path
+    mock_adapter.scandir.side_effect = lambda p: listings[Path(p)]
+
+    from app.utils.folder_tree.exceptions import ValidationError
+    with pytest.raises(ValidationError, match="Missing 2 folders"):
+        manager.validate_folder_tree(base_path, structure)
+
+    # Only the base and the listing miss "c" are probed; missing "c" is never listed
+    # and its child "d" is reported absent without a probe
+    probed = [Path(call.args[0]) for call in mock_adapter.exists.call_args_list]
+    assert probed == [base_path, base_path / "a" / "c"]
+    assert base_path / "a" / "c" not in [Path(call.args[0]) for call in mock_adapter.scandir.call_args_list]
+
 def test_migrate_logic(manager, mock_adapter):
     src = Path("/src")
     dst = Path("/dst")
@@ -60,3 +87,117 @@ def test_dry_run_logic(manager, mock_adapter):
     # Should NOT call adapter methods that modify state
     mock_adapter.mkdir.assert_not_called()
     mock_adapter.write_file.assert_not_called()
+    mock_adapter.write_file_fast.assert_not_called()
+
+def test_dry_run_logs_once(manager, caplog):
+    structure = {"dir": {"f.txt": "x"}, "other": {}}
+
+    with caplog.at_level(logging.INFO):
+        manager.create_folder_tree(Path("/mock/base"), structure, dry_run=True)
+
+    records = [r for r in caplog.records if "[DRY-RUN]" in r.getMessage()]
+    assert len(records) == 1
+    message = records[0].getMessage()
+    for rel in ("dir", "other", os.path.join("dir", "f.txt")):
+        assert rel in message
+
+def test_create_folder_tree_parents_first(manager, mock_adapter):
+    structure = {"a": {"b": {"c": {}}}, "d": {}}
+    base_path = Path("/mock/base")
+    mock_adapter.exists.return_value = False
+
+    manager.create_folder_tree(base_path, structure)
+
+    mock_adapter.mkdir.assert_called_once_with(base_path, parents=True, exist_ok=True)
+    layers = [[Path(p) for p in call.args[0]] for call in mock_adapter.mkdir_many.call_args_list]
+    assert layers == [
+        [base_path / "a", base_path / "d"],
+        [base_path / "a" / "b"],
+        [base_path / "a" / "b" / "c"],
+    ]
+
+def test_cleanup_uses_listing(manager, mock_adapter):
+    structure = {"a": {"b": {}}, "gone": {"child": {}}}
+    base_path = Path("/mock/base")
+    listings = {
+        base_path: {"a": EntryInfo("a", True, False)},
+        base_path / "a": {"b": EntryInfo("b", True, False)},
+        base_path / "a" / "b": {},
+    }
+    mock_adapter.scandir.side_effect = lambda p: listings[Path(p)]
+    mock_adapter.exists.return_value = False
+
+    manager.cleanup_folder_tree(base_path, structure, confirm=True)
+
+    removed = [Path(call.args[0]) for call in mock_adapter.remove.call_args_list]
+    assert removed == [base_path / "a" / "b", base_path / "a"]
+    # Listed entries need no probe; only the miss "gone" is confirmed
+    mock_adapter.exists.assert_called_once_with(str(base_path / "gone"))
+
+def test_validate_listing_miss_falls_back_to_exists(manager, mock_adapter):
+    # Case-insensitive filesystem: "Docs" exists, but the listing spells it "docs"
+    base_path = Path("/mock/base")
+    listings = {base_path: {"docs": EntryInfo("docs", True, False)}, base_path / "Docs": {}}
+    mock_adapter.scandir.side_effect = lambda p: listings[Path(p)]
+    mock_adapter.exists.return_value = True
+    mock_adapter.is_dir.return_value = True
+
+    assert manager.validate_folder_tree(base_path, {"Docs": {}})
+    mock_adapter.exists.assert_any_call(str(base_path / "Docs"))
+
+def test_create_folder_tree_perms(manager, mock_adapter):
+    structure = {
+        "private": {"_perms": 0o700, "_note": "ignored", "inner": {}},
+        "bad": {"_perms": "0o700"},
+    }
+    base_path = Path("/mock/base")
+
+    manager.create_folder_tree(base_path, structure)
+
+    mock_adapter.chmod.assert_called_once_with(str(base_path / "private"), 0o700)
+    created = [Path(p) for call in mock_adapter.mkdir_many.call_args_list for p in call.args[0]]
+    assert base_path / "private" / "inner" in created
+    assert not any(p.name.startswith("_") for p in created)
+
+def test_validate_unreadable_folder_falls_back_to_exists(manager, mock_adapter):
+    structure = {"locked": {"inner": {}}}
+    base_path = Path("/mock/base")
+    mock_adapter.exists.return_value = True
+
+    def scandir(p):
+        if Path(p) == base_path / "locked":
+            raise PermissionError(13, "Permission denied", str(p))
+        return {"locked": EntryInfo("locked", True, False)}
+    mock_adapter.scandir.side_effect = scandir
+
+    assert manager.validate_folder_tree(base_path, structure)
+    mock_adapter.exists.assert_any_call(str(base_path / "locked" / "inner"))
+
+def test_empty_base_keeps_keys_relative(manager, mock_adapter):
+    mock_adapter.scandir.return_value = None
+    mock_adapter.exists.return_value = True
+
+    manager.create_folder_tree("", {"k": {"f.txt": "x"}})
+    mock_adapter.mkdir_many.assert_called_once_with(["k"], exist_ok=True)
+    mock_adapter.write_file_fast.assert_called_once_with(os.path.join("k", "f.txt"), b"x", overwrite=False)
+
+    assert manager.validate_folder_tree("", {"k": {}})
+    mock_adapter.exists.assert_any_call("k")
+
+def test_create_folder_tree_perms_applied_last(manager, mock_adapter):
+    structure = {"ro": {"_perms": 0o555, "inner": {"_perms": 0o700, "f.txt": "x"}}}
+    base_path = Path("/mock/base")
+
+    manager.create_folder_tree(base_path, structure)
+
+    calls = [name for name, _, _ in mock_adapter.method_calls if name in ("mkdir_many", "write_file_fast", "chmod")]
+    assert calls == ["mkdir_many", "mkdir_many", "write_file_fast", "chmod", "chmod"]
+    chmods = [(Path(call.args[0]), call.args[1]) for call in mock_adapter.chmod.call_args_list]
+    assert chmods == [(base_path / "ro" / "inner", 0o700), (base_path / "ro", 0o555)]
+
+def test_create_folder_tree_flushes_on_failure(manager, mock_adapter):
+    mock_adapter.write_file_fast.side_effect = Exception("write failed")
+
+    with pytest.raises(FolderTreeError, match="write failed"):
+        manager.create_folder_tree(Path("/mock/base"), {"f.txt": "x"})
+    mock_adapter.flush.assert_called_once_with()
@@ -0,0 +1,247 @@
+import errno
+import os
+import pytest
+from app.utils.folder_tree import uring
+from app.utils.folder_tree.uring import IoUringAdapter
+from app.utils.folder_tree.manager import FolderTreeManager
+from app.utils.folder_tree.exceptions import FolderTreeError
+
+
+def _ring_available() -> bool:
+    a = IoUringAdapter()
+    try:
+        return a.available
+    finally:
+        a.close()
+
+requires_ring = pytest.mark.skipif(not _ring_available(), reason="liburing-ffi or io_uring not available")
+
+@pytest.fixture
+def adapter():
+    a = IoUringAdapter(queue_depth=4)
+    yield a
+    a.close()
+
+@requires_ring
+def test_create_folder_tree(adapter, tmp_path, tree_structure):
+    FolderTreeManager(adapter=adapter).create_folder_tree(tmp_path, tree_structure)
+
+    assert (tmp_path / "a" / "b" / "c" / "deep.txt").read_text() == "deep"
+    assert (tmp_path / "a" / "empty.txt").read_text() == ""
+    assert (tmp_path / "top.txt").read_text() == "top"
+
+@requires_ring
+@pytest.mark.skipif(os.name == 'nt', reason="chmod works differently on Windows")
+def test_perms_applied(adapter, tmp_path, tree_structure):
+    FolderTreeManager(adapter=adapter).create_folder_tree(tmp_path, tree_structure)
+    assert ((tmp_path / "locked").stat().st_mode & 0o777) == 0o700
+    assert ((tmp_path / "readonly").stat().st_mode & 0o777) == 0o555
+    assert ((tmp_path / "readonly" / "inner").stat().st_mode & 0o777) == 0o700
+    assert (tmp_path / "readonly" / "inner" / "note.txt").read_text() == "note"
+
+@requires_ring
+def test_overwrite(adapter, tmp_path):
+    manager = FolderTreeManager(adapter=adapter)
+    (tmp_path / "top.txt").write_text("old")
+
+    manager.create_folder_tree(tmp_path, {"top.txt": "new"})
+    assert (tmp_path / "top.txt").read_text() == "old"
+
+    manager.create_folder_tree(tmp_path, {"top.txt": "new"}, overwrite=True)
+    assert (tmp_path / "top.txt").read_text() == "new"
+
+@requires_ring
+def test_folder_blocked_by_file(adapter, tmp_path):
+    (tmp_path / "blocker").write_text("")
+    with pytest.raises(FolderTreeError):
+        FolderTreeManager(adapter=adapter).create_folder_tree(tmp_path, {"blocker": {"x": {}}})
+
+def test_fallback_without_liburing(monkeypatch, tmp_path, tree_structure):
+    monkeypatch.setattr(uring, "_load_liburing", lambda: None)
+    adapter = IoUringAdapter()
+    assert not adapter.available
+
+    FolderTreeManager(adapter=adapter).create_folder_tree(tmp_path, tree_structure)
+    assert (tmp_path / "a" / "b" / "c" / "deep.txt").read_text() == "deep"
+
+@requires_ring
+def test_write_file_creates_parent(adapter, tmp_path):
+    adapter.write_file(tmp_path / "missing" / "f.txt", "x")
+    adapter.flush()
+    assert (tmp_path / "missing" / "f.txt").read_text() == "x"
+
+@requires_ring
+def test_reads_see_queued_work(adapter, tmp_path):
+    adapter.mkdir(tmp_path / "d", parents=False)
+    assert adapter.is_dir(tmp_path / "d")
+    adapter.write_file_fast(tmp_path / "d" / "f.txt", b"x")
+    assert "f.txt" in adapter.scandir(tmp_path / "d")
+
+class FakeRing:
+    """Stands in for _Ring: records each wave and answers every op via respond(op)."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.waves = []
+
+    def run(self, ops):
+        self.waves.append(ops)
+        return [self.respond(op) for op in ops]
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def fake_adapter(monkeypatch):
+    monkeypatch.setattr(uring, "_load_liburing", lambda: None)
+    return IoUringAdapter()
+
+def test_flush_dirs_in_depth_waves(fake_adapter, tmp_path):
+    ring = fake_adapter._ring = FakeRing(lambda op: 0)
+    a, c = str(tmp_path / "a"), str(tmp_path / "c")
+    fake_adapter.mkdir_many([a, os.path.join(a, "b"), c, os.path.join(a, "b", "d")])
+    fake_adapter.flush()
+
+    waves = [[os.fsdecode(op[2]) for op in wave] for wave in ring.waves]
+    assert waves == [[a, c], [os.path.join(a, "b")], [os.path.join(a, "b", "d")]]
+
+def test_flush_dirs_eexist(fake_adapter, tmp_path):
+    fake_adapter._ring = FakeRing(lambda op: -errno.EEXIST)
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "file").write_text("")
+
+    fake_adapter.mkdir(tmp_path / "dir", parents=False)
+    fake_adapter.flush()
+
+    fake_adapter.mkdir(tmp_path / "file", parents=False)
+    with pytest.raises(FileExistsError):
+        fake_adapter.flush()
+
+    fake_adapter.mkdir(tmp_path / "dir", parents=False, exist_ok=False)
+    with pytest.raises(FileExistsError):
+        fake_adapter.flush()
+
+def test_flush_files_closes_on_error(fake_adapter, tmp_path):
+    fds = {"ok1": 10, "denied": -errno.EACCES, "ok2": 12}
+
+    def respond(op):
+        if op[0] == "io_uring_prep_openat":
+            return fds[os.path.basename(os.fsdecode(op[2]))]
+        if op[0] == "io_uring_prep_write":
+            return op[3]
+        return 0
+
+    ring = fake_adapter._ring = FakeRing(respond)
+    for name in fds:
+        fake_adapter.write_file_fast(tmp_path / name, b"data")
+    with pytest.raises(PermissionError) as exc:
+        fake_adapter.flush()
+
+    assert exc.value.filename == str(tmp_path / "denied")
+    closed = [op[1] for op in ring.waves[-1] if op[0] == "io_uring_prep_close"]
+    assert closed == [10, 12]
+
+    # Nothing stays queued for a later flush
+    ring.waves.clear()
+    fake_adapter.flush()
+    assert ring.waves == []
+
+def test_write_file_enoent_creates_parent(fake_adapter, tmp_path):
+    fake_adapter._ring = FakeRing(lambda op: -errno.ENOENT)
+    target = tmp_path / "missing" / "f.txt"
+
+    fake_adapter.write_file(target, "x")
+    fake_adapter.flush()
+    assert target.read_text() == "x"
+
+    fake_adapter.write_file_fast(tmp_path / "other" / "g.txt", b"x")
+    with pytest.raises(FileNotFoundError):
+        fake_adapter.flush()
+
+class FakeLib:
+    """
+    Minimal liburing stand-in: completes each submission in reverse order. Accepts at
+    most max_submit entries per submit and reports the opcodes in supported.
+    """
+
+    def __init__(self, max_submit=None, supported=tuple(uring._REQUIRED_OPS.values())):
+        self.pending = []
+        self.completed = []
+        self.submits = []
+        self.max_submit = max_submit
+        self.supported = supported
+        self.probes_freed = 0
+
+    def io_uring_get_probe(self):
+        return None if self.supported is None else 1
+
+    def io_uring_opcode_supported(self, probe, op):
+        return op in self.supported
+
+    def io_uring_free_probe(self, probe):
+        self.probes_freed += 1
+
+    def io_uring_queue_init(self, entries, ring, flags):
+        return 0
+
+    def io_uring_queue_exit(self, ring):
+        pass
+
+    def io_uring_get_sqe(self, ring):
+        sqe = {}
+        self.pending.append(sqe)
+        return sqe
+
+    def io_uring_prep_mkdirat(self, sqe, dfd, path, mode):
+        sqe["res"] = len(path)
+
+    def io_uring_sqe_set_data64(self, sqe, data):
+        sqe["user_data"] = data
+
+    def io_uring_submit(self, ring):
+        taken = self.pending[:self.max_submit]
+        self.pending = self.pending[len(taken):]
+        self.submits.append(len(taken))
+        self.completed.extend(reversed(taken))
+        return len(taken)
+
+    def io_uring_wait_cqe_nr(self, ring, cqe_ref, wait_nr):
+        sqe = self.completed.pop(0)
+        self.cqe = uring._Cqe(sqe["user_data"], sqe["res"], 0)
+        cqe_ref._obj.contents = self.cqe
+        return 0
+
+    def io_uring_cqe_seen(self, ring, cqe):
+        pass
+
+def test_ring_run_chunks_and_orders_results():
+    lib = FakeLib()
+    ring = uring._Ring(lib, entries=2)
+    ops = [("io_uring_prep_mkdirat", uring.AT_FDCWD, b"x" * n, 0o777) for n in (1, 2, 3)]
+
+    assert ring.run(ops) == [1, 2, 3]
+    assert lib.submits == [2, 1]
+
+def test_ring_run_short_submit_raises():
+    lib = FakeLib(max_submit=1)
+    ring = uring._Ring(lib, entries=2)
+    ops = [("io_uring_prep_mkdirat", uring.AT_FDCWD, b"x" * n, 0o777) for n in (1, 2)]
+
+    with pytest.raises(OSError, match="1 of 2"):
+        ring.run(ops)
+    # Only the accepted entry was waited for
+    assert lib.completed == []
+
+@pytest.mark.parametrize("supported", [None, (18, 19, 23)])
+def test_fallback_without_required_ops(monkeypatch, supported):
+    lib = FakeLib(supported=supported)
+    monkeypatch.setattr(uring, "_load_liburing", lambda: lib)
+
+    assert not IoUringAdapter().available
+    assert lib.probes_freed == (0 if supported is None else 1)
+
+def test_probe_accepts_required_ops(monkeypatch):
+    monkeypatch.setattr(uring, "_load_liburing", FakeLib)
+    adapter = IoUringAdapter()
+    assert adapter.available
+    adapter.close()